@@ -65,7 +65,12 @@ class Game:
 
 
     def score(self):
-        score = 0
+        frames = self.frames()
+        return frames[-1]["total"] if frames else 0
+
+    def frames(self) -> List[Dict]:
+        frames = []
+        total = 0
         roll_index = 0
 
         for frame in range(10):
@@ -73,19 +78,41 @@ class Game:
                 break
 
             if self.rolls[roll_index] == 10:
-                score += 10 + self.strike_bonus(roll_index)
-                roll_index += 1
+                frame_type = "strike"
+                frame_score = 10 + self.strike_bonus(roll_index)
+                complete = roll_index + 2 < len(self.rolls)
+                frame_size = 1
             else:
                 frame_score = self.rolls[roll_index]
                 if roll_index + 1 < len(self.rolls):
                     frame_score += self.rolls[roll_index + 1]
                 if frame_score == 10:
-                    score += 10 + self.spare_bonus(roll_index)
+                    frame_type = "spare"
+                    frame_score += self.spare_bonus(roll_index)
+                    complete = roll_index + 2 < len(self.rolls)
                 else:
-                    score += frame_score
-                roll_index += 2
+                    frame_type = "open"
+                    complete = roll_index + 1 < len(self.rolls)
+                frame_size = 2
 
-        return score
+            # The 10th frame keeps its fill balls
+            if frame == 9:
+                frame_rolls = self.rolls[roll_index:]
+            else:
+                frame_rolls = self.rolls[roll_index:roll_index + frame_size]
+
+            total += frame_score
+            frames.append({
+                "frame": frame + 1,
+                "rolls": frame_rolls,
+                "type": frame_type,
+                "score": frame_score,
+                "total": total,
+                "complete": complete
+            })
+            roll_index += frame_size
+
+        return frames
 
     def strike_bonus(self, roll_index):
         bonus = 0
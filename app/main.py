@@ -6,7 +6,9 @@ from uuid import uuid4
 from app.game import Game
 from app.player import Player
 from app.storage import Storage
-from typing import Dict
+from app.summary import generate_local_summary
+from app.prompt import build_messages, DEFAULT_TOKEN_BUDGET
+from typing import Dict, Optional
 import os
 from dotenv import load_dotenv
 from fastapi import HTTPException
@@ -33,6 +35,14 @@ game_storage = Storage(GAME_STORAGE_FILE)
 # Initialize the OpenAI client
 client = OpenAI(api_key=os.getenv('OPENAI_API_KEY'))
 
+# Summary engine: "llm" calls OpenAI (falling back to "local" on failure), "local" is rule-based
+SUMMARY_MODES = ("llm", "local")
+SUMMARY_MODE = os.getenv('SUMMARY_MODE', 'llm').lower()
+if SUMMARY_MODE not in SUMMARY_MODES:
+    raise ValueError(f"Invalid SUMMARY_MODE '{SUMMARY_MODE}', expected one of: {', '.join(SUMMARY_MODES)}")
+SUMMARY_TIMEOUT = float(os.getenv('SUMMARY_TIMEOUT', '10'))
+PROMPT_TOKEN_BUDGET = int(os.getenv('PROMPT_TOKEN_BUDGET', DEFAULT_TOKEN_BUDGET))
+
 
 # Load existing players from storage
 player_data = player_storage.load_data()
@@ -93,6 +103,7 @@ def record_roll(game_id: str, roll: Roll):
                 for game_summary in players[associated_player_id].games:
                     if game_summary["game_id"] == game_id:
                         game_summary["score"] = final_score
+                        game_summary["rolls"] = game.get_rolls()
                         break
                 player_storage.save_data({pid: p.to_dict() for pid, p in players.items()})
 
@@ -117,52 +128,64 @@ def get_score(game_id: str):
     raise HTTPException(status_code=404, detail="Game not found")
 
 @app.get("/games/{game_id}/summary")
-def get_summary(game_id: str):
+def get_summary(game_id: str, mode: Optional[str] = None):
+    # Only a mode sent by the client can be invalid; SUMMARY_MODE is checked at startup
+    if mode:
+        mode = mode.lower()
+        if mode not in SUMMARY_MODES:
+            raise HTTPException(status_code=400, detail=f"Invalid summary mode, expected one of: {', '.join(SUMMARY_MODES)}")
+    else:
+        mode = SUMMARY_MODE
+
     # Search for the game in player records (as it might be completed)
     for player in players.values():
         for game_summary in player.games:
             if game_summary["game_id"] == game_id:
-                # Fetch the necessary data: rolls, score, and player name
-                rolls = game_summary.get("rolls", [])
-                score = game_summary.get("score", 0)
+                # Games still in progress hold their rolls in memory, completed ones in the player record
+                is_game_over = game_id not in games
+                if is_game_over:
+                    game = Game.from_dict(game_summary)
+                    score = game_summary.get("score", 0)
+                else:
+                    game = games[game_id]
+                    score = game.score()
                 player_name = player.name
 
-                # Check if the game is completed
-                is_game_over = len(rolls) >= 12 or sum(rolls[:2]) >= 10
+                frames = game.frames()
+                average_score = get_previous_average(player, game_id)
 
-                # Generate the prompt for OpenAI API
-                prompt = generate_prompt(player_name, rolls, score, is_game_over)
+                # Without rolls there is nothing to describe beyond the final score
+                if mode == "local" or not frames:
+                    summary = generate_local_summary(player_name, frames, score, is_game_over, average_score)
+                    return {"summary": summary, "source": "local"}
 
                 try:
-                    # Call OpenAI API to generate the summary
-                    response = client.chat.completions.create(
+                    # Compact game encoding; the static system prompt is shared across requests
+                    messages = build_messages(player_name, frames, score, is_game_over, average_score, PROMPT_TOKEN_BUDGET)
+
+                    # Call OpenAI API to generate the summary, a single attempt so SUMMARY_TIMEOUT bounds the wait
+                    response = client.with_options(max_retries=0, timeout=SUMMARY_TIMEOUT).chat.completions.create(
                         model="gpt-4",
-                        messages=[
-                            {"role": "system", "content": "You are a helpful scorer that summarizes bowling games. Please talk like real scorer."},
-                            {"role": "user", "content": prompt}
-                        ],
+                        messages=messages,
                         max_tokens=300,
                         temperature=0.6
                     )
 
                     # Extract the summary from the response
                     summary = response.choices[0].message.content.strip()
-                    return {"summary": summary}  # Return the generated summary
+                    return {"summary": summary, "source": "llm"}  # Return the generated summary
 
-                except OpenAIError as e:
-                    # Handle OpenAI API errors gracefully
-                    raise HTTPException(status_code=500, detail=f"Error generating summary: {str(e)}")
+                except (OpenAIError, ValueError):
+                    # Fall back to the local engine when the API errors, times out or the prompt is over budget
+                    summary = generate_local_summary(player_name, frames, score, is_game_over, average_score)
+                    return {"summary": summary, "source": "local"}
 
     # If the game is not found, return a 404 error
     raise HTTPException(status_code=404, detail="Game not found or summary unavailable")
 
-def generate_prompt(player_name, rolls, score, is_game_over):
-    status = "The game is still ongoing." if not is_game_over else "The game is now completed."
-    
-    prompt = (
-        f"Provide a detailed summary of a bowling game for the player '{player_name}'. "
-        f"The following are the rolls: {rolls}. The current score is {score}. "
-        f"{status} Mention any strikes, spares, or interesting patterns. "
-        f"Summarize the gameplay and highlight the player’s performance."
-    )
-    return prompt
\ No newline at end of file
+def get_previous_average(player: Player, game_id: str) -> Optional[float]:
+    # Average over the player's other completed games
+    scores = [g["score"] for g in player.games if g["game_id"] != game_id and g["game_id"] not in games]
+    if not scores:
+        return None
+    return sum(scores) / len(scores)
@@ -0,0 +1,81 @@
+# app/prompt.py
+
+import re
+from typing import List, Dict, Optional
+from app.summary import frame_marks, game_highlights
+
+# Static instructions go in the system message and never change between requests,
+# so the shared prefix stays identical and provider-side prompt caching can apply.
+SYSTEM_PROMPT = (
+    "Bowling scorer: summarize the game in 3-5 sentences like a real scorer. "
+    "X strike, / spare, - miss. Trust the given totals and highlights."
+)
+
+# Input token budget for the whole request, system prompt included
+DEFAULT_TOKEN_BUDGET = 150
+MAX_NAME_LENGTH = 32
+
+
+def estimate_tokens(text: str) -> int:
+    # Rough GPT tokenizer estimate: every symbol is a token, words cost about one per 4 characters
+    return sum((len(piece) + 3) // 4 for piece in re.findall(r"\w+|[^\w\s]", text))
+
+
+def encode_frames(frames: List[Dict]) -> str:
+    return " ".join("".join(frame_marks(f["rolls"])) for f in frames)
+
+
+def encode_totals(frames: List[Dict]) -> str:
+    return " ".join(str(f["total"]) for f in frames)
+
+
+def encode_highlights(frames: List[Dict], score: int, is_game_over: bool,
+                      average_score: Optional[float] = None) -> str:
+    highlights = game_highlights(frames)
+    parts = [f"{highlights['strikes']}X {highlights['spares']}/ {highlights['opens']} open"]
+    for run in highlights["strike_runs"]:
+        name = "turkey" if len(run) == 3 else f"{len(run)} strikes"
+        frames_span = str(run[0]) if run[0] == run[-1] else f"{run[0]}-{run[-1]}"
+        parts.append(f"{name} {frames_span}")
+    if highlights["best"]:
+        best = highlights["best"]
+        worst = highlights["worst"]
+        parts.append(f"best {best['frame']}:{best['score']}")
+        parts.append(f"worst {worst['frame']}:{worst['score']}")
+    if is_game_over and average_score is not None:
+        parts.append(f"avg {average_score:.0f} {round(score - average_score):+d}")
+    return ", ".join(parts)
+
+
+def generate_prompt(player_name: str, frames: List[Dict], score: int, is_game_over: bool,
+                    average_score: Optional[float], token_budget: int) -> str:
+    # token_budget covers the user prompt only
+    name = player_name[:MAX_NAME_LENGTH]
+    lines = [
+        f"{name} ({'final' if is_game_over else 'live'}, {score})",
+        f"Frames: {encode_frames(frames)}"
+    ]
+    # Optional lines, dropped from the end until the prompt fits the budget
+    optional = [
+        f"Highlights: {encode_highlights(frames, score, is_game_over, average_score)}",
+        f"Totals: {encode_totals(frames)}"
+    ]
+
+    while optional and estimate_tokens("\n".join(lines + optional)) > token_budget:
+        optional.pop()
+
+    prompt = "\n".join(lines + optional)
+    if estimate_tokens(prompt) > token_budget:
+        raise ValueError("Prompt exceeds the token budget")
+    return prompt
+
+
+def build_messages(player_name: str, frames: List[Dict], score: int, is_game_over: bool,
+                   average_score: Optional[float] = None,
+                   token_budget: int = DEFAULT_TOKEN_BUDGET) -> List[Dict]:
+    user_budget = token_budget - estimate_tokens(SYSTEM_PROMPT)
+    prompt = generate_prompt(player_name, frames, score, is_game_over, average_score, user_budget)
+    return [
+        {"role": "system", "content": SYSTEM_PROMPT},
+        {"role": "user", "content": prompt}
+    ]
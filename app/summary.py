@@ -0,0 +1,158 @@
+# app/summary.py
+
+from typing import List, Dict, Optional
+
+
+def frame_marks(rolls: List[int]) -> List[str]:
+    # Scoresheet marks: X for a strike, / for a spare, - for a miss
+    marks = []
+    first_ball = None
+    for pins in rolls:
+        if first_ball is None:
+            if pins == 10:
+                marks.append("X")
+                continue
+            marks.append(str(pins) if pins else "-")
+            first_ball = pins
+        else:
+            if first_ball + pins == 10:
+                marks.append("/")
+            else:
+                marks.append(str(pins) if pins else "-")
+            first_ball = None
+    return marks
+
+
+def ordinal(n: int) -> str:
+    if 10 <= n % 100 <= 20:
+        suffix = "th"
+    else:
+        suffix = {1: "st", 2: "nd", 3: "rd"}.get(n % 10, "th")
+    return f"{n}{suffix}"
+
+
+def _plural(count: int, word: str) -> str:
+    return f"{count} {word}" if count == 1 else f"{count} {word}s"
+
+
+def _strike_runs(frames: List[Dict]) -> List[List[int]]:
+    # Consecutive strikes, three or more long, as the frame number of each strike.
+    # Fill balls count, so the 10th can appear more than once in a run.
+    runs = []
+    current = []
+    for frame in frames:
+        for mark in frame_marks(frame["rolls"]):
+            if mark == "X":
+                current.append(frame["frame"])
+                continue
+            if len(current) >= 3:
+                runs.append(current)
+            current = []
+    if len(current) >= 3:
+        runs.append(current)
+    return runs
+
+
+def _describe_run(run: List[int]) -> str:
+    if len(run) == 3:
+        name = "a turkey"
+    else:
+        name = f"{len(run)} strikes in a row"
+    if run[0] == run[-1]:
+        return f"{name} in the {ordinal(run[0])}"
+    return f"{name} from the {ordinal(run[0])} through the {ordinal(run[-1])}"
+
+
+def game_highlights(frames: List[Dict]) -> Dict:
+    scored = [f for f in frames if f["complete"]]
+    best = worst = None
+    if len(scored) >= 2:
+        best = max(scored, key=lambda f: f["score"])
+        worst = min(scored, key=lambda f: f["score"])
+        if best["score"] == worst["score"]:
+            best = worst = None
+    # Strikes and spares are counted per ball so the 10th frame's fill balls are included
+    marks = [mark for f in frames for mark in frame_marks(f["rolls"])]
+    return {
+        "strikes": marks.count("X"),
+        "spares": marks.count("/"),
+        "opens": sum(1 for f in frames if f["type"] == "open" and f["complete"]),
+        "strike_runs": _strike_runs(frames),
+        "best": best,
+        "worst": worst
+    }
+
+
+def _tenth_frame(frames: List[Dict], player_name: str) -> Optional[str]:
+    if len(frames) < 10:
+        return None
+    tenth = frames[9]
+    marks = ", ".join(frame_marks(tenth["rolls"]))
+    if tenth["type"] == "open":
+        return f"{player_name} left the door open in the 10th with {marks}."
+    return f"{player_name} marked in the 10th, going {marks}."
+
+
+def _average_comparison(score: int, average_score: float) -> str:
+    difference = round(score - average_score)
+    if difference > 0:
+        return f"That's {_plural(difference, 'pin')} above the {average_score:.0f} average."
+    if difference < 0:
+        return f"That's {_plural(-difference, 'pin')} below the {average_score:.0f} average."
+    return f"Right on the {average_score:.0f} average."
+
+
+def generate_score_summary(player_name: str, score: int, average_score: Optional[float] = None) -> str:
+    # Completed games recorded without their rolls only have a final score
+    sentences = [f"{player_name} finished with a {score}."]
+    if average_score is not None:
+        sentences.append(_average_comparison(score, average_score))
+    return " ".join(sentences)
+
+
+def generate_local_summary(player_name: str, frames: List[Dict], score: int,
+                           is_game_over: bool, average_score: Optional[float] = None) -> str:
+    if not frames:
+        if is_game_over:
+            return generate_score_summary(player_name, score, average_score)
+        return f"{player_name} hasn't thrown a ball yet. The lanes are waiting."
+
+    if is_game_over and score == 300:
+        return (f"Perfect game! {player_name} threw twelve strikes in a row for a 300. "
+                f"Nothing left on the deck all night.")
+
+    highlights = game_highlights(frames)
+    strikes = highlights["strikes"]
+    spares = highlights["spares"]
+    opens = highlights["opens"]
+
+    sentences = []
+    if is_game_over:
+        sentences.append(f"{player_name} finishes with a {score}.")
+    else:
+        sentences.append(f"{player_name} is sitting at {score} through {_plural(len(frames), 'frame')}, game still in progress.")
+
+    sentences.append(f"That's {_plural(strikes, 'strike')}, {_plural(spares, 'spare')} "
+                     f"and {_plural(opens, 'open frame')}.")
+
+    if is_game_over and opens == 0:
+        sentences.append("A clean game, every frame marked.")
+
+    runs = highlights["strike_runs"]
+    if runs:
+        sentences.append("Highlight: " + "; ".join(_describe_run(run) for run in runs) + ".")
+
+    best = highlights["best"]
+    worst = highlights["worst"]
+    if best:
+        sentences.append(f"Best frame was the {ordinal(best['frame'])}, worth {best['score']}, "
+                         f"and the {ordinal(worst['frame'])} was the low point at {worst['score']}.")
+
+    tenth = _tenth_frame(frames, player_name)
+    if tenth and is_game_over:
+        sentences.append(tenth)
+
+    if is_game_over and average_score is not None:
+        sentences.append(_average_comparison(score, average_score))
+
+    return " ".join(sentences)
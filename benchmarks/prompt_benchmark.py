@@ -0,0 +1,101 @@
+# benchmarks/prompt_benchmark.py
+#
+# Compares the legacy summary prompt with app.prompt on input token count,
+# prompt build time, and latency against a stub client.
+#
+# Token counts use tiktoken's gpt-4 encoding when it is installed and can load,
+# otherwise app.prompt.estimate_tokens. The stub latency is modelled from the
+# token count (fixed overhead plus per-token prefill), so it restates the token
+# difference in milliseconds rather than measuring anything independently.
+# The build column is real wall time spent constructing the messages.
+#
+#   python -m benchmarks.prompt_benchmark
+
+import time
+from typing import List, Dict
+from app.game import Game
+from app.prompt import build_messages, estimate_tokens
+
+try:
+    import tiktoken
+    ENCODING = tiktoken.encoding_for_model("gpt-4")
+except Exception:
+    # Not installed, or the encoding file could not be downloaded
+    ENCODING = None
+
+# Stub model: fixed overhead plus a per-input-token prefill cost, in seconds
+STUB_BASE_LATENCY = 0.001
+STUB_TOKEN_LATENCY = 0.00005
+ITERATIONS = 50
+
+GAMES = {
+    "perfect": [10] * 12,
+    "mixed": [10, 10, 10, 7, 3, 9, 0, 1, 1, 5, 5, 6, 2, 8, 1, 10, 7, 2],
+    "all spares": [5] * 21,
+    "live": [10, 7, 3, 9]
+}
+
+
+def legacy_messages(player_name: str, rolls: List[int], score: int, is_game_over: bool) -> List[Dict]:
+    # The prompt get_summary sent before app.prompt existed
+    status = "The game is still ongoing." if not is_game_over else "The game is now completed."
+    prompt = (
+        f"Provide a detailed summary of a bowling game for the player '{player_name}'. "
+        f"The following are the rolls: {rolls}. The current score is {score}. "
+        f"{status} Mention any strikes, spares, or interesting patterns. "
+        f"Summarize the gameplay and highlight the player’s performance."
+    )
+    return [
+        {"role": "system", "content": "You are a helpful scorer that summarizes bowling games. Please talk like real scorer."},
+        {"role": "user", "content": prompt}
+    ]
+
+
+def count_tokens(text: str) -> int:
+    if ENCODING is not None:
+        return len(ENCODING.encode(text))
+    return estimate_tokens(text)
+
+
+def message_tokens(messages: List[Dict]) -> int:
+    return sum(count_tokens(m["content"]) for m in messages)
+
+
+def stub_create(messages: List[Dict]):
+    time.sleep(STUB_BASE_LATENCY + STUB_TOKEN_LATENCY * message_tokens(messages))
+
+
+def measure(call) -> float:
+    # Mean milliseconds per call
+    start = time.perf_counter()
+    for _ in range(ITERATIONS):
+        call()
+    return (time.perf_counter() - start) / ITERATIONS * 1000
+
+
+def main():
+    source = "tiktoken gpt-4" if ENCODING is not None else "estimate_tokens heuristic (install tiktoken for exact counts)"
+    print(f"Token counts: {source}")
+    print("Stub ms is modelled from the token count; build us is measured")
+    print(f"{'game':<12}{'before tok':>12}{'after tok':>11}{'after user':>12}"
+          f"{'before ms':>11}{'after ms':>10}{'before us':>11}{'after us':>10}")
+    for name, rolls in GAMES.items():
+        game = Game.from_dict({"rolls": rolls})
+        is_game_over = game.is_game_over()
+
+        def build_before():
+            return legacy_messages("Alice", rolls, game.score(), is_game_over)
+
+        def build_after():
+            return build_messages("Alice", game.frames(), game.score(), is_game_over, average_score=150)
+
+        before = build_before()
+        after = build_after()
+        print(f"{name:<12}{message_tokens(before):>12}{message_tokens(after):>11}"
+              f"{count_tokens(after[1]['content']):>12}"
+              f"{measure(lambda: stub_create(before)):>11.2f}{measure(lambda: stub_create(after)):>10.2f}"
+              f"{measure(build_before) * 1000:>11.1f}{measure(build_after) * 1000:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -82,3 +82,31 @@ def test_from_dict():
     data = {"rolls": [10, 3, 7]}
     game = Game.from_dict(data)
     assert game.get_rolls() == [10, 3, 7]
+
+def test_frames():
+    game = Game.from_dict({"rolls": [10, 7, 3, 9, 0]})
+    frames = game.frames()
+    assert [f["type"] for f in frames] == ["strike", "spare", "open"]
+    assert [f["score"] for f in frames] == [20, 19, 9]
+    assert [f["total"] for f in frames] == [20, 39, 48]
+    assert frames[-1]["total"] == game.score()
+
+def test_frames_incomplete_bonus():
+    game = Game()
+    game.roll(10)
+    game.roll(3)
+    frames = game.frames()
+    assert frames[0]["complete"] is False
+    assert frames[1]["complete"] is False
+
+def test_frames_tenth_frame_fill_balls():
+    game = Game()
+    for _ in range(18):
+        game.roll(0)
+    game.roll(10)
+    game.roll(7)
+    game.roll(3)
+    frames = game.frames()
+    assert len(frames) == 10
+    assert frames[9]["rolls"] == [10, 7, 3]
+    assert frames[9]["score"] == 20
@@ -213,3 +213,127 @@ async def test_record_roll_for_invalid_game(client, player_id):
     response = await client.post(f"/games/invalid_game_id/rolls", json={"pins": 5})
     assert response.status_code == 404
     assert response.json()["detail"] == "Game not found"
+
+@pytest.mark.anyio
+async def test_local_summary_for_completed_game(client, game_id):
+    for _ in range(12):
+        response = await client.post(f"/games/{game_id}/rolls", json={"pins": 10})
+        assert response.status_code == 200
+
+    response = await client.get(f"/games/{game_id}/summary", params={"mode": "local"})
+    assert response.status_code == 200
+    assert response.json()["source"] == "local"
+    assert "Perfect game" in response.json()["summary"]
+
+@pytest.mark.anyio
+async def test_local_summary_for_game_in_progress(client, game_id):
+    for pins in [5, 5, 3]:
+        response = await client.post(f"/games/{game_id}/rolls", json={"pins": pins})
+        assert response.status_code == 200
+
+    response = await client.get(f"/games/{game_id}/summary", params={"mode": "local"})
+    assert response.status_code == 200
+    assert "sitting at 16" in response.json()["summary"]
+
+def openai_client(handler):
+    # Real OpenAI client whose HTTP requests are answered by handler
+    import httpx
+    from openai import OpenAI
+    return OpenAI(api_key="test", http_client=httpx.Client(transport=httpx.MockTransport(handler)))
+
+@pytest.mark.anyio
+async def test_summary_falls_back_to_local_on_openai_timeout(client, game_id, monkeypatch):
+    from app import main
+    import httpx
+    attempts = []
+
+    def timeout(request):
+        attempts.append(request)
+        raise httpx.ReadTimeout("timed out", request=request)
+
+    monkeypatch.setattr(main, "client", openai_client(timeout))
+    response = await client.post(f"/games/{game_id}/rolls", json={"pins": 7})
+    assert response.status_code == 200
+
+    response = await client.get(f"/games/{game_id}/summary")
+    assert response.status_code == 200
+    assert response.json()["source"] == "local"
+    assert "sitting at 7" in response.json()["summary"]
+    assert len(attempts) == 1  # no retries on top of SUMMARY_TIMEOUT
+
+@pytest.mark.anyio
+async def test_summary_for_completed_game_without_rolls(client, player_id, monkeypatch):
+    from app import main
+    attempts = []
+    monkeypatch.setattr(main, "client", openai_client(attempts.append))
+
+    # Games completed before rolls were kept in the player record only have a score
+    main.players[player_id].add_game({"game_id": "old-game", "score": 150}, "old-game")
+    main.players[player_id].add_game({"game_id": "older-game", "score": 130}, "older-game")
+
+    response = await client.get("/games/old-game/summary")
+    assert response.status_code == 200
+    assert response.json() == {"summary": "Alice finished with a 150. That's 20 pins above the 130 average.", "source": "local"}
+    assert attempts == []
+
+@pytest.mark.anyio
+async def test_summary_invalid_mode(client, game_id):
+    response = await client.get(f"/games/{game_id}/summary", params={"mode": "fancy"})
+    assert response.status_code == 400
+    assert "Invalid summary mode" in response.json()["detail"]
+
+@pytest.mark.anyio
+async def test_llm_summary_uses_compact_prompt(client, game_id, monkeypatch):
+    from app import main
+    from app.prompt import SYSTEM_PROMPT
+    import httpx
+    sent = {}
+
+    def create(request):
+        sent.update(json.loads(request.content))
+        return httpx.Response(200, json={
+            "id": "chatcmpl-test",
+            "object": "chat.completion",
+            "created": 0,
+            "model": "gpt-4",
+            "choices": [{"index": 0, "finish_reason": "stop",
+                         "message": {"role": "assistant", "content": " Nice game. "}}]
+        })
+
+    monkeypatch.setattr(main, "client", openai_client(create))
+    for pins in [10, 7, 3]:
+        response = await client.post(f"/games/{game_id}/rolls", json={"pins": pins})
+        assert response.status_code == 200
+
+    response = await client.get(f"/games/{game_id}/summary", params={"mode": "llm"})
+    assert response.status_code == 200
+    assert response.json() == {"summary": "Nice game.", "source": "llm"}
+    assert sent["messages"][0]["content"] == SYSTEM_PROMPT
+    assert "Frames: X 7/" in sent["messages"][1]["content"]
+
+@pytest.mark.anyio
+async def test_summary_uses_configured_mode_by_default(client, game_id, monkeypatch):
+    from app import main
+    attempts = []
+    monkeypatch.setattr(main, "client", openai_client(attempts.append))
+    monkeypatch.setattr(main, "SUMMARY_MODE", "local")
+    response = await client.post(f"/games/{game_id}/rolls", json={"pins": 7})
+    assert response.status_code == 200
+
+    for params in ({}, {"mode": ""}):
+        response = await client.get(f"/games/{game_id}/summary", params=params)
+        assert response.status_code == 200
+        assert response.json()["source"] == "local"
+    assert attempts == []
+
+    response = await client.get(f"/games/{game_id}/summary", params={"mode": "bogus"})
+    assert response.status_code == 400
+
+def test_invalid_summary_mode_config_fails_at_import():
+    import subprocess
+    import sys
+    env = dict(os.environ, SUMMARY_MODE="lcoal", OPENAI_API_KEY="test")
+    result = subprocess.run([sys.executable, "-c", "import app.main"], cwd=BASE_DIR, env=env,
+                            capture_output=True, text=True)
+    assert result.returncode != 0
+    assert "Invalid SUMMARY_MODE 'lcoal'" in result.stderr
@@ -0,0 +1,59 @@
+# tests/test_prompt.py
+
+import pytest
+from app.game import Game
+from app.prompt import (SYSTEM_PROMPT, estimate_tokens, encode_frames, encode_totals,
+                        encode_highlights, generate_prompt, build_messages)
+
+MIXED_ROLLS = [10, 10, 10, 7, 3, 9, 0, 1, 1, 5, 5, 6, 2, 8, 1, 10, 7, 2]
+
+def frames_for(rolls):
+    return Game.from_dict({"rolls": rolls}).frames()
+
+def test_encode_frames():
+    assert encode_frames(frames_for(MIXED_ROLLS)) == "X X X 7/ 9- 11 5/ 62 81 X72"
+    assert encode_frames(frames_for([10] * 12)) == "X X X X X X X X X XXX"
+
+def test_encode_totals():
+    assert encode_totals(frames_for(MIXED_ROLLS)) == "30 57 77 96 105 107 123 131 140 159"
+
+def test_encode_highlights():
+    highlights = encode_highlights(frames_for(MIXED_ROLLS), 159, True, average_score=150)
+    assert highlights == "4X 2/ 4 open, turkey 1-3, best 1:30, worst 6:2, avg 150 +9"
+
+def test_generate_prompt():
+    prompt = generate_prompt("Alice", frames_for(MIXED_ROLLS), 159, True, None, 100)
+    assert prompt.splitlines() == [
+        "Alice (final, 159)",
+        "Frames: X X X 7/ 9- 11 5/ 62 81 X72",
+        "Highlights: 4X 2/ 4 open, turkey 1-3, best 1:30, worst 6:2",
+        "Totals: 30 57 77 96 105 107 123 131 140 159"
+    ]
+
+def test_generate_prompt_drops_optional_lines_to_fit_budget():
+    frames = frames_for(MIXED_ROLLS)
+    full = generate_prompt("Alice", frames, 159, True, None, 100)
+    budget = estimate_tokens(full) - 1
+    prompt = generate_prompt("Alice", frames, 159, True, None, budget)
+    assert "Totals" not in prompt
+    assert "Highlights" in prompt
+    assert estimate_tokens(prompt) <= budget
+
+def test_generate_prompt_over_budget():
+    with pytest.raises(ValueError, match="Prompt exceeds the token budget"):
+        generate_prompt("Alice", frames_for(MIXED_ROLLS), 159, True, None, 5)
+
+def test_build_messages_keeps_system_prompt_static():
+    first = build_messages("Alice", frames_for(MIXED_ROLLS), 159, True)
+    second = build_messages("Bob", frames_for([5, 5, 3]), 16, False)
+    assert first[0] == second[0] == {"role": "system", "content": SYSTEM_PROMPT}
+    assert "Bob (live, 16)" in second[1]["content"]
+
+def test_encode_highlights_counts_fill_ball_strikes():
+    frames = frames_for([10] * 11 + [9])
+    assert encode_frames(frames).count("X") == 11
+    assert encode_highlights(frames, 299, True).startswith("11X 0/ 0 open, 11 strikes 1-10")
+
+def test_encode_highlights_strike_run_in_tenth():
+    frames = frames_for([0] * 18 + [10, 10, 10])
+    assert encode_highlights(frames, 30, True).startswith("3X 0/ 9 open, turkey 10,")
@@ -0,0 +1,62 @@
+# tests/test_summary.py
+
+from app.game import Game
+from app.summary import frame_marks, ordinal, generate_local_summary
+
+def play(rolls):
+    return Game.from_dict({"rolls": rolls})
+
+def test_frame_marks():
+    assert frame_marks([10]) == ["X"]
+    assert frame_marks([7, 3]) == ["7", "/"]
+    assert frame_marks([0, 0]) == ["-", "-"]
+    assert frame_marks([10, 10, 10]) == ["X", "X", "X"]
+    assert frame_marks([10, 7, 3]) == ["X", "7", "/"]
+    assert frame_marks([9, 1, 10]) == ["9", "/", "X"]
+
+def test_ordinal():
+    assert [ordinal(n) for n in (1, 2, 3, 4, 10, 11)] == ["1st", "2nd", "3rd", "4th", "10th", "11th"]
+
+def test_summary_no_rolls():
+    assert "hasn't thrown a ball" in generate_local_summary("Alice", [], 0, False)
+
+def test_summary_perfect_game():
+    game = play([10] * 12)
+    summary = generate_local_summary("Alice", game.frames(), game.score(), True)
+    assert "Perfect game" in summary
+    assert "300" in summary
+
+def test_summary_completed_game():
+    game = play([10, 10, 10, 7, 3, 9, 0, 1, 1, 5, 5, 6, 2, 8, 1, 10, 7, 2])
+    summary = generate_local_summary("Alice", game.frames(), game.score(), True, average_score=100)
+    assert summary.startswith(f"Alice finishes with a {game.score()}.")
+    assert "4 strikes, 2 spares and 4 open frames" in summary
+    assert "a turkey from the 1st through the 3rd" in summary
+    assert "Best frame was the 1st, worth 30" in summary
+    assert "low point at 2" in summary
+    assert "marked in the 10th, going X, 7, 2" in summary
+    assert f"{game.score() - 100} pins above the 100 average" in summary
+
+def test_summary_game_in_progress():
+    game = play([5, 5, 3])
+    summary = generate_local_summary("Alice", game.frames(), game.score(), False)
+    assert "sitting at 16 through 2 frames" in summary
+    assert "1 spare" in summary
+    assert "10th" not in summary
+
+def test_summary_counts_fill_ball_strikes():
+    game = play([10] * 11 + [9])
+    summary = generate_local_summary("Alice", game.frames(), game.score(), True)
+    assert summary.startswith("Alice finishes with a 299.")
+    assert "11 strikes, 0 spares" in summary
+    assert "11 strikes in a row from the 1st through the 10th" in summary
+
+def test_summary_counts_strike_after_tenth_frame_spare():
+    game = play([10] * 9 + [9, 1, 10])
+    summary = generate_local_summary("Alice", game.frames(), game.score(), True)
+    assert "10 strikes, 1 spare" in summary
+    assert "9 strikes in a row from the 1st through the 9th" in summary
+
+def test_summary_completed_game_without_rolls():
+    summary = generate_local_summary("Alice", [], 150, True, average_score=140)
+    assert summary == "Alice finished with a 150. That's 10 pins above the 140 average."